@@ -3,109 +3,293 @@
 
 import sys
 import os
+import threading
+import queue
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QLabel, QLineEdit, QFileDialog, QTableWidget, 
-    QTableWidgetItem, QComboBox, QMessageBox, QHeaderView, QPlainTextEdit
+    QTableWidgetItem, QComboBox, QMessageBox, QHeaderView, QPlainTextEdit,
+    QCheckBox
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QThread, QTimer, Signal
 from sw_controller import SolidWorksController
 
-class BatchExportWorker(QThread):
+def _move_into_place(staged_dir, dst_dir):
+    """Moves every file one export staged (e.g. per-body STLs too) into dst_dir, overwriting."""
+    for name in os.listdir(staged_dir):
+        src = os.path.join(staged_dir, name)
+        dst = os.path.join(dst_dir, name)
+        try:
+            os.replace(src, dst)  # Same volume: an atomic rename
+        except OSError:
+            shutil.move(src, dst)  # Different volume: copy, then delete the staged file
+
+class LoggingWorker(QThread):
+    """Base for SW worker threads; coalesces log lines into batched log_update signals."""
+    log_update = Signal(str)            # verbose logging
+
+    # Log lines are coalesced so the GUI thread gets a handful of signals per second
+    # instead of one per dimension/file event.
+    LOG_FLUSH_INTERVAL_MS = 100
+    LOG_FLUSH_LINES = 32
+
+    def __init__(self):
+        super().__init__()
+        self._log_buf = []
+        self._log_lock = threading.Lock()
+        
+        # The timer lives on the GUI thread, whose event loop keeps running while this
+        # worker is blocked inside a rebuild or save. Lines logged just before a long COM
+        # call therefore still reach the console within one interval.
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._on_flush_timer)
+        self.started.connect(self._flush_timer.start, Qt.QueuedConnection)
+
+    def _buffered_log(self, msg):
+        """Queues a log line, emitting early if the batch grows large."""
+        with self._log_lock:
+            self._log_buf.append(msg)
+            full = len(self._log_buf) >= self.LOG_FLUSH_LINES
+        if full:
+            self._flush_log()
+
+    def _flush_log(self):
+        """Emits all buffered log lines as a single newline-joined message."""
+        # Called from both the worker and the GUI timer; emitting under the lock keeps
+        # batches in order.
+        with self._log_lock:
+            if self._log_buf:
+                self.log_update.emit("\n".join(self._log_buf))
+                self._log_buf = []
+
+    def _on_flush_timer(self):
+        self._flush_log()
+        if self.isFinished():
+            self._flush_timer.stop()
+
+class DimensionFetchWorker(LoggingWorker):
+    """Background worker that loads the part and extracts its dimensions for the comboboxes."""
+    dimensions_ready = Signal(list)     # dimension names
+    failed = Signal(str)                # error message
+
+    def __init__(self, model_path, sw):
+        super().__init__()
+        self.model_path = model_path
+        self.sw = sw
+
+    def run(self):
+        # Whatever happens, the window must hear back through failed or dimensions_ready,
+        # otherwise its load controls stay disabled.
+        dims = None
+        message = "Failed to load dimensions from SolidWorks."
+        try:
+            dims = self._fetch()
+        except Exception as e:
+            self._buffered_log(f"ERROR: Extraction crashed: {e}")
+            message = "Dimension extraction crashed. See console for details."
+        finally:
+            self._flush_log()
+            
+        if dims is None:
+            self.failed.emit(message)
+        else:
+            self.dimensions_ready.emit(dims)
+
+    def _fetch(self):
+        """Loads the part and returns its dimensions, or None if SolidWorks couldn't load it."""
+        sw = self.sw
+        if not (sw.connect(log_callback=self._buffered_log)
+                and sw.open_document(self.model_path, log_callback=self._buffered_log)):
+            sw.close()
+            self._buffered_log("ERROR: Failed to load dimensions. Check SolidWorks connection.")
+            return None
+            
+        try:
+            self._buffered_log("Part loaded successfully. Extracting dimensions...")
+            return sw.get_all_dimensions(log_callback=self._buffered_log)
+        finally:
+            # Keep the part open for the batch export; only drop this thread's COM references
+            sw.detach()
+
+class BatchExportWorker(LoggingWorker):
     """Background worker to handle SW operations without freezing the UI."""
     progress_update = Signal(int, str)  # row_index, status_text
-    log_update = Signal(str)            # verbose logging
     finished = Signal()
 
-    def __init__(self, model_path, output_dir, export_format, configurations):
+    # Finished exports are moved from a local staging folder into the batch folder on a
+    # small thread pool, overlapping the disk write with the next row's rebuild.
+    MOVE_WORKERS = 2
+    MAX_PENDING_MOVES = 4  # Back-pressure so a slow target disk can't pile up staged files
+
+    def __init__(self, model_path, output_dir, export_format, configurations, sw=None, compact_export=False):
         super().__init__()
+        self.sw = sw or SolidWorksController()  # May already hold the part loaded by fetch_dimensions
         self.model_path = model_path
         self.output_dir = output_dir
         self.export_format = export_format
+        self.compact_export = compact_export
         self.configurations = configurations  # List of dicts: {'row': int, 'filename': str, 'dims': {name: val}}
+        self._last_status = {}  # row_index -> last status emitted, to drop repeats
+        self._moves_by_target = {}  # out_file -> latest move future targeting it
+
+    def _emit_status(self, row, status):
+        """Emits progress_update only when a row's status actually changes."""
+        if self._last_status.get(row) != status:
+            self._last_status[row] = status
+            self.progress_update.emit(row, status)
+
+    def _queue_move(self, movers, pending, staged_dir, out_file, row=None):
+        """Hands a staged export to the mover pool, blocking while too many are in flight."""
+        if pending.full():
+            self._finish_move(*pending.get())
+        # Rows sharing a filename must land in table order, so the later row wins
+        prior = self._moves_by_target.get(out_file)
+        if prior:
+            wait([prior])
+        future = movers.submit(_move_into_place, staged_dir, os.path.dirname(out_file))
+        self._moves_by_target[out_file] = future
+        pending.put((row, out_file, future))
+
+    def _reap_moves(self, pending):
+        """Reports moves that have already completed, oldest first, without blocking."""
+        # Only this thread consumes the queue, so peeking at its head is safe
+        while not pending.empty() and pending.queue[0][2].done():
+            self._finish_move(*pending.get())
+
+    def _finish_move(self, row, out_file, future):
+        """Waits for one background move and reports the final outcome of its export."""
+        name = os.path.basename(out_file)
+        try:
+            future.result()
+        except OSError as e:
+            self._buffered_log(f"ERROR: Failed to save {name}: {e}")
+            if row is not None: self._emit_status(row, "✗ Error")
+            return
+        self._buffered_log(f"SUCCESS: Saved {name}")
+        if row is not None: self._emit_status(row, "✓ Saved")
 
     def run(self):
-        self.log_update.emit("Initializing SolidWorks Controller...")
-        sw = SolidWorksController()
+        # The controller's COM proxies are thread-bound, so attach to the running
+        # SolidWorks from this thread. The part itself stays loaded from the fetch.
+        self._buffered_log("Attaching to SolidWorks...")
+        sw = self.sw
+        sw.compact_export = self.compact_export
         
-        if not sw.connect(log_callback=self.log_update.emit):
-            self.progress_update.emit(-1, "Failed to connect to SolidWorks.")
-            self.finished.emit()
-            return
-            
-        self.log_update.emit(f"Opening document: {self.model_path}")
-        if not sw.open_document(self.model_path, log_callback=self.log_update.emit):
-            self.progress_update.emit(-1, "Failed to open document.")
-            self.log_update.emit("ERROR: Failed to open document.")
-            sw.close()
-            self.finished.emit()
-            return
-
+        # Everything runs inside the try so the finally always closes the part and emits
+        # finished, even if connecting or opening raises.
+        staging = None
         try:
-            self.log_update.emit("SolidWorks ready. Starting batch export...")
+            if not sw.connect(log_callback=self._buffered_log):
+                self._flush_log()
+                self._emit_status(-1, "Failed to connect to SolidWorks.")
+                return
+                
+            self._buffered_log(f"Opening document: {self.model_path}")
+            if not sw.open_document(self.model_path, log_callback=self._buffered_log):
+                self._buffered_log("ERROR: Failed to open document.")
+                self._flush_log()
+                self._emit_status(-1, "Failed to open document.")
+                return
+
+            self._buffered_log("SolidWorks ready. Starting batch export...")
 
             # --- Create dedicated subfolder based on part name ---
             part_name = Path(self.model_path).stem
-            batch_folder = Path(self.output_dir) / f"{part_name}_batch_exports"
-            batch_folder.mkdir(parents=True, exist_ok=True)
-            self.log_update.emit(f"Created export directory: {batch_folder}")
-
-            # --- Export the original unmodified part first ---
-            orig_filename = f"{part_name}_original.{self.export_format}"
-            orig_out_file = batch_folder / orig_filename
-            self.log_update.emit(f"\n--- Exporting original state to: {orig_out_file} ---")
+            # Kept as a plain string so per-row output paths need no Path parsing
+            batch_folder = os.path.join(self.output_dir, f"{part_name}_batch_exports")
+            os.makedirs(batch_folder, exist_ok=True)
+            self._buffered_log(f"Created export directory: {batch_folder}")
+
+            # SaveAs3 writes into a local staging folder, one subfolder per export so rows with
+            # the same filename never share a path; the mover pool puts files in place
+            staging = tempfile.mkdtemp(prefix="sw_batch_")
+            self._buffered_log(f"Staging exports in: {staging}")
+            pending = queue.Queue(maxsize=self.MAX_PENDING_MOVES)
             
-            success_orig = sw.export_file(orig_out_file, log_callback=self.log_update.emit)
-            if success_orig:
-                self.log_update.emit(f"SUCCESS: Saved {orig_filename}")
-            else:
-                self.log_update.emit(f"ERROR: Failed to save {orig_filename}")
-
-            for config in self.configurations:
-                row = config['row']
-                filename = config['filename']
-                dims = config['dims']
-                
-                self.progress_update.emit(row, "Processing...")
+            with ThreadPoolExecutor(max_workers=self.MOVE_WORKERS) as movers:
+                # --- Export the original unmodified part first ---
+                orig_filename = f"{part_name}_original.{self.export_format}"
+                orig_out_file = os.path.join(batch_folder, orig_filename)
+                orig_dir = os.path.join(staging, "original")
+                os.mkdir(orig_dir)
+                orig_staged = os.path.join(orig_dir, orig_filename)
+                self._buffered_log(f"\n--- Exporting original state to: {orig_out_file} ---")
                 
-                # Combine part name and user-defined config name
-                full_filename = f"{part_name}_{filename}"
-                self.log_update.emit(f"\n--- Processing Row {row} | File: {full_filename} ---")
+                if sw.export_file(orig_staged, log_callback=self._buffered_log):
+                    self._queue_move(movers, pending, orig_dir, orig_out_file)
+                else:
+                    self._buffered_log(f"ERROR: Failed to save {orig_filename}")
+
+                # Loop invariants, hoisted so each row only does plain string concatenation
+                prefix = f"{part_name}_"
+                ext = self.export_format
                 
-                # Apply dimensions
-                for dim_name, val in dims.items():
-                    self.log_update.emit(f"Setting {dim_name} = {val}")
-                    sw.modify_dimension(dim_name, val)
+                # Rows run in table order: a blank cell keeps the value the row above set, and a
+                # repeated filename must be won by the lower row. Unchanged dimensions are still
+                # skipped by the controller.
+                for config in self.configurations:
+                    row = config['row']
+                    filename = config['filename']
+                    dims = config['dims']
                     
-                self.log_update.emit("Rebuilding model...")
-                sw.rebuild()
-                
-                # Construct output path inside the new subfolder
-                out_file = batch_folder / f"{full_filename}.{self.export_format}"
-                
-                # Export
-                self.log_update.emit(f"Exporting to: {out_file}")
-                success = sw.export_file(out_file, log_callback=self.log_update.emit)
-                
-                if success:
-                    self.progress_update.emit(row, "✓ Saved")
-                    self.log_update.emit(f"SUCCESS: Saved {full_filename}.{self.export_format}")
-                else:
-                    self.progress_update.emit(row, "✗ Error")
-                    self.log_update.emit(f"ERROR: Failed to save {full_filename}.{self.export_format}")
+                    self._emit_status(row, "Processing...")
+                    
+                    # Combine part name and user-defined config name
+                    full_filename = prefix + filename
+                    self._buffered_log(f"\n--- Processing Row {row} | File: {full_filename} ---")
+                    
+                    # Construct output path inside the new subfolder, and its staging twin
+                    out_file = f"{batch_folder}{os.sep}{full_filename}.{ext}"
+                    staged_dir = f"{staging}{os.sep}{row}"
+                    os.mkdir(staged_dir)
+                    staged = f"{staged_dir}{os.sep}{full_filename}.{ext}"
+                    
+                    # Apply dimensions, rebuild and export in a single controller call
+                    success = sw.export_configuration(dims, staged, display_path=out_file,
+                                                      log_callback=self._buffered_log)
+                    
+                    if success:
+                        # "✓ Saved" is reported once the file has been moved into place
+                        self._queue_move(movers, pending, staged_dir, out_file, row)
+                    else:
+                        self._emit_status(row, "✗ Error")
+                        self._buffered_log(f"ERROR: Failed to save {full_filename}.{ext}")
+                    
+                    # Report rows whose files are already in place instead of waiting for
+                    # back-pressure or the end of the batch
+                    self._reap_moves(pending)
 
-            self.log_update.emit("\nBatch export completed. Closing document...")
+                while not pending.empty():
+                    self._finish_move(*pending.get())
+
+            self._buffered_log("\nBatch export completed. Closing document...")
             
         except Exception as e:
-            self.log_update.emit(f"\nFATAL THREAD ERROR: {e}")
-            self.progress_update.emit(-1, "Worker crashed.")
+            self._buffered_log(f"\nFATAL THREAD ERROR: {e}")
+            self._flush_log()
+            self._emit_status(-1, "Worker crashed.")
         finally:
-            # THIS GUARANTEES the invisible SolidWorks drops the file lock no matter what happens
-            sw.close()
-            self.finished.emit()
+            if staging:
+                shutil.rmtree(staging, ignore_errors=True)
+            # THIS GUARANTEES the invisible SolidWorks drops the file lock no matter what happens.
+            # Closing also discards the batch's dimension edits, so the next batch (and its
+            # "original" export) starts again from the saved part.
+            try:
+                sw.close()
+            finally:
+                self._flush_log()
+                self.finished.emit()
 
 class MainWindow(QMainWindow):
+    # Statuses a fast row overwrites almost immediately; only painted if they stick around
+    TRANSIENT_STATUSES = {"Processing..."}
+    STATUS_DELAY_MS = 50
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("NeuralFab Batch Exporter")
@@ -113,6 +297,10 @@ class MainWindow(QMainWindow):
 
         self.available_dimensions = []
         self.dimension_columns = []  # Tracks which column index holds a dimension
+        self.sw = SolidWorksController()  # Keeps the loaded part open between fetch and export
+        self.worker = None
+        self.fetch_worker = None
+        self._status_timers = {}  # row_index -> pending QTimer for a transient status
 
         self.init_ui()
 
@@ -147,6 +335,10 @@ class MainWindow(QMainWindow):
         self.combo_format.addItems(["STEP", "IGES", "STL"])
         top_layout.addWidget(QLabel("Format:"))
         top_layout.addWidget(self.combo_format)
+        
+        self.chk_compact = QCheckBox("Compact STEP/STL")
+        self.chk_compact.setToolTip("Export STEP as AP203 and STL as binary for smaller, faster writes.")
+        top_layout.addWidget(self.chk_compact)
 
         layout.addLayout(top_layout)
 
@@ -200,6 +392,8 @@ class MainWindow(QMainWindow):
         self.console_output.setReadOnly(True)
         self.console_output.setStyleSheet("background-color: #1e1e1e; color: #4af626; font-family: Consolas, monospace;")
         self.console_output.setMaximumHeight(150)
+        # Bounded scrollback keeps appends O(1) and memory flat on long batches
+        self.console_output.setMaximumBlockCount(2000)
         layout.addWidget(self.console_output)
         self.append_log("System initialized. Ready.")
 
@@ -220,40 +414,39 @@ class MainWindow(QMainWindow):
             self.line_out_folder.setText(folder)
 
     def append_log(self, text):
-        """Appends text to the console output and scrolls to the bottom."""
+        """Appends a (possibly multi-line) batch of text to the console and scrolls to the bottom."""
         self.console_output.appendPlainText(text)
         scrollbar = self.console_output.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
     def fetch_dimensions(self, file_path):
-        """Temporarily opens SolidWorks to grab available dimensions for the comboboxes."""
+        """Loads the part in a background thread to grab available dimensions for the comboboxes."""
         self.btn_load_part.setText("Loading dimensions...")
+        self.btn_load_part.setEnabled(False)
+        self.btn_calculate.setEnabled(False)  # The fetch worker owns self.sw until it finishes
         self.append_log(f"Connecting to SolidWorks to load part: {file_path}")
-        QApplication.processEvents()
         
-        # A quick local function to force the UI to repaint on every log message
-        def live_log(msg):
-            self.append_log(msg)
-            QApplication.processEvents()
-            
-        sw = SolidWorksController()
-        if sw.connect(log_callback=live_log) and sw.open_document(file_path, log_callback=live_log):
-            try:
-                self.append_log("Part loaded successfully. Extracting dimensions...")
-                self.available_dimensions = sw.get_all_dimensions(log_callback=live_log)
-                self.btn_add_dim.setEnabled(True)
-                self.btn_load_part.setText("Load Part (.SLDPRT)")
-                self.append_log(f"Extracted {len(self.available_dimensions)} dimensions.")
-                QMessageBox.information(self, "Success", f"Loaded {len(self.available_dimensions)} dimensions.")
-            except Exception as e:
-                self.append_log(f"ERROR: Extraction crashed: {e}")
-            finally:
-                # Guarantee document closure even if the macro crashes
-                sw.close()
-        else:
-            self.append_log("ERROR: Failed to load dimensions. Check SolidWorks connection.")
-            self.btn_load_part.setText("Load Part (.SLDPRT)")
-            QMessageBox.critical(self, "Error", "Failed to load dimensions from SolidWorks.")
+        self.fetch_worker = DimensionFetchWorker(file_path, self.sw)
+        self.fetch_worker.log_update.connect(self.append_log, Qt.QueuedConnection)
+        self.fetch_worker.dimensions_ready.connect(self.dimensions_loaded, Qt.QueuedConnection)
+        self.fetch_worker.failed.connect(self.dimensions_failed, Qt.QueuedConnection)
+        self.fetch_worker.start()
+
+    def dimensions_loaded(self, dims):
+        self.available_dimensions = dims
+        self.btn_add_dim.setEnabled(True)
+        self.reset_load_controls()
+        self.append_log(f"Extracted {len(self.available_dimensions)} dimensions.")
+        QMessageBox.information(self, "Success", f"Loaded {len(self.available_dimensions)} dimensions.")
+
+    def dimensions_failed(self, message):
+        self.reset_load_controls()
+        QMessageBox.critical(self, "Error", message)
+
+    def reset_load_controls(self):
+        self.btn_load_part.setText("Load Part (.SLDPRT)")
+        self.btn_load_part.setEnabled(True)
+        self.btn_calculate.setEnabled(True)
 
     def add_dimension_column(self):
         if not self.available_dimensions:
@@ -273,21 +466,32 @@ class MainWindow(QMainWindow):
             self.table.setItem(row, col_idx, QTableWidgetItem(""))
 
     def add_config_row(self):
-        row_idx = self.table.rowCount()
-        self.table.insertRow(row_idx)
-        
-        # Status Cell
-        status_item = QTableWidgetItem("-")
-        status_item.setFlags(Qt.ItemIsEnabled)
-        status_item.setTextAlignment(Qt.AlignCenter)
-        self.table.setItem(row_idx, 0, status_item)
-        
-        # Filename cell
-        self.table.setItem(row_idx, 1, QTableWidgetItem(f"config_{row_idx}"))
-        
-        # Blank cells for dimensions
-        for col in self.dimension_columns:
-            self.table.setItem(row_idx, col, QTableWidgetItem(""))
+        self.add_config_rows(1)
+
+    def add_config_rows(self, n):
+        """Appends n config rows with a single resize instead of one insertRow (and relayout) each."""
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            base = self.table.rowCount()
+            self.table.setRowCount(base + n)
+            for row_idx in range(base, base + n):
+                # Status Cell
+                status_item = QTableWidgetItem("-")
+                status_item.setFlags(Qt.ItemIsEnabled)
+                status_item.setTextAlignment(Qt.AlignCenter)
+                self.table.setItem(row_idx, 0, status_item)
+                
+                # Filename cell
+                self.table.setItem(row_idx, 1, QTableWidgetItem(f"config_{row_idx}"))
+                
+                # Blank cells for dimensions
+                for col in self.dimension_columns:
+                    self.table.setItem(row_idx, col, QTableWidgetItem(""))
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+            self.table.viewport().update()
 
     def start_calculation(self):
         if not self.line_part_path.text() or not self.line_out_folder.text():
@@ -336,14 +540,16 @@ class MainWindow(QMainWindow):
         # Disable UI during calculation
         self.btn_calculate.setEnabled(False)
         self.btn_calculate.setText("Running...")
+        self.btn_load_part.setEnabled(False)  # The worker owns self.sw until it finishes
 
         # Start Worker
         fmt = self.combo_format.currentText().lower()
         self.append_log(f"\nStarting batch export for {len(configs)} configurations...")
-        self.worker = BatchExportWorker(self.line_part_path.text(), self.line_out_folder.text(), fmt, configs)
-        self.worker.progress_update.connect(self.update_status)
-        self.worker.log_update.connect(self.append_log)
-        self.worker.finished.connect(self.calculation_finished)
+        self.worker = BatchExportWorker(self.line_part_path.text(), self.line_out_folder.text(), fmt, configs,
+                                        sw=self.sw, compact_export=self.chk_compact.isChecked())
+        self.worker.progress_update.connect(self.update_status, Qt.QueuedConnection)
+        self.worker.log_update.connect(self.append_log, Qt.QueuedConnection)
+        self.worker.finished.connect(self.calculation_finished, Qt.QueuedConnection)
         self.worker.start()
 
     def update_status(self, row, status):
@@ -351,6 +557,26 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", status)
             return
             
+        # A newer status always supersedes one still waiting to be shown
+        timer = self._status_timers.pop(row, None)
+        if timer:
+            timer.stop()
+            timer.deleteLater()
+            
+        if status in self.TRANSIENT_STATUSES:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda: self._apply_status(row, status))
+            self._status_timers[row] = timer
+            timer.start(self.STATUS_DELAY_MS)
+        else:
+            self._apply_status(row, status)
+
+    def _apply_status(self, row, status):
+        timer = self._status_timers.pop(row, None)
+        if timer:
+            timer.deleteLater()
+            
         item = self.table.item(row, 0)
         if item:
             item.setText(status)
@@ -359,8 +585,19 @@ class MainWindow(QMainWindow):
         self.append_log("Worker finished execution.")
         self.btn_calculate.setEnabled(True)
         self.btn_calculate.setText("Calculate configurations")
+        self.btn_load_part.setEnabled(True)
         QMessageBox.information(self, "Done", "Batch export completed!")
 
+    def closeEvent(self, event):
+        """Closes a part still held open from fetch_dimensions so SolidWorks drops its file lock."""
+        busy = any(w and w.isRunning() for w in (self.worker, self.fetch_worker))
+        if self.sw.doc_title and not busy:
+            # Never launch SolidWorks just to close a part. If it has already been quit,
+            # the part went with it, so close() only clears the remembered document.
+            self.sw.attach_running()
+            self.sw.close()
+        super().closeEvent(event)
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = MainWindow()
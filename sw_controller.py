@@ -1,20 +1,70 @@
-import win32com.client as win32
-import pythoncom
 import os
-import time
-from pathlib import Path
+import math
+import functools
+
+# swconst enum values used for compact exports
+SW_STEP_AP = 56             # swUserPreferenceIntegerValue_e.swStepAP (203 or 214)
+SW_STL_BINARY_FORMAT = 69   # swUserPreferenceToggle_e.swSTLBinaryFormat
+
+@functools.cache
+def _get_win32():
+    """Imports pywin32 on first use, so importing this module stays cheap for non-COM paths."""
+    import win32com.client as win32
+    import pythoncom
+    return win32, pythoncom
+
+def _get(obj, name):
+    """Reads a no-argument COM member, which late binding may expose as a property or a method."""
+    attr = getattr(obj, name)
+    return attr() if callable(attr) else attr
+
+def _cast(obj, interface):
+    """Casts a COM object to a generated typelib interface, staying late-bound if that fails."""
+    try:
+        win32, _ = _get_win32()
+        return win32.CastTo(obj, interface)
+    except Exception:
+        return obj
+
+def _collect_sub_features(sub_feat):
+    """Follows a GetNextSubFeature chain into a list."""
+    subs = []
+    while sub_feat is not None:
+        subs.append(sub_feat)
+        sub_feat = _get(sub_feat, "GetNextSubFeature")
+    return subs
+
+def _open_failure_reason(path):
+    """Explains a failed OpenDoc, telling a missing file apart from a corrupt or locked one."""
+    if not os.path.exists(path):
+        return f"File does not exist at {path}"
+    return "File may be corrupt or already open."
 
 class SolidWorksController:
     def __init__(self):
         self.sw_app = None
         self.sw_model = None
+        self.model_path = None  # Document this controller has loaded, kept across detach()
+        self.doc_title = None
+        self._last_dims = {}  # dim_name -> last value (mm) written to the open document
+        self._param_cache = {}  # dim_name -> resolved Parameter proxy for the open document
+        self.compact_export = False  # AP203 STEP / binary STL instead of the user's defaults
+        self._saved_prefs = {}  # (setter, pref_id) -> user's value, restored on close()
 
     def connect(self, log_callback=None):
         """Initializes the COM connection to SolidWorks."""
-        pythoncom.CoInitialize()
         try:
+            # Inside the try so a missing/broken pywin32 is reported as a failed connection
+            win32, pythoncom = _get_win32()
+            pythoncom.CoInitialize()
             if log_callback: log_callback("Attempting to connect to SolidWorks...")
-            self.sw_app = win32.Dispatch("SldWorks.Application")
+            try:
+                # Early binding: makepy-generated proxies carry pre-resolved DISPIDs, so calls
+                # skip the GetIDsOfNames round-trip late binding makes per attribute access.
+                self.sw_app = win32.gencache.EnsureDispatch("SldWorks.Application")
+            except Exception as e:
+                if log_callback: log_callback(f"Typelib bindings unavailable ({e}), using late binding.")
+                self.sw_app = win32.Dispatch("SldWorks.Application")
             
             # CRITICAL EXPORT FIX: SolidWorks MUST be visible and UserControl=True 
             # for export translators (STEP/STL) to load. If hidden, exports crash.
@@ -33,104 +83,121 @@ class SolidWorksController:
             if log_callback: log_callback(f"ERROR: Connection failure: {e}")
             return False
 
+    def attach_running(self):
+        """Attaches to an already-running SolidWorks without launching one or changing its window.
+        
+        Returns False if SolidWorks isn't running.
+        """
+        try:
+            win32, pythoncom = _get_win32()
+            pythoncom.CoInitialize()
+            self.sw_app = win32.GetActiveObject("SldWorks.Application")
+            return True
+        except Exception:
+            self.sw_app = None
+            return False
+
     def open_document(self, path, log_callback=None):
         """Opens a SolidWorks part document."""
-        if not os.path.exists(path):
-            if log_callback: log_callback(f"ERROR: File does not exist at {path}")
-            return False
-            
+        # No up-front os.path.exists(): OpenDoc already fails on a missing file, and the
+        # extra stat can cost hundreds of ms on network drives. Only failures pay for it.
         try:
-            # We open the document normally. (Hiding the document itself causes STEP 
-            # exports to crash because the exporter cannot read the graphics body).
-            self.sw_model = self.sw_app.OpenDoc(str(path), 1) # 1 = swDocPART
+            path = os.path.normpath(str(path))
+            
+            # Only one document is managed at a time, so release a previously loaded part
+            if self.doc_title and self.model_path != path:
+                self.sw_app.CloseDoc(self.doc_title)
+                self.model_path = None
+                self.doc_title = None
+            
+            # Reuse the part if SolidWorks already has it loaded (e.g. left open by the
+            # dimension fetch), skipping a multi-second reload and full geometry evaluation.
+            self.sw_model = self.sw_app.GetOpenDocumentByName(path)
+            if self.sw_model is not None:
+                if log_callback: log_callback("Document already loaded in SolidWorks, reusing it.")
+            else:
+                # We open the document normally. (Hiding the document itself causes STEP 
+                # exports to crash because the exporter cannot read the graphics body).
+                self.sw_model = self.sw_app.OpenDoc(path, 1) # 1 = swDocPART
                 
             if self.sw_model is None:
-                if log_callback: log_callback("ERROR: OpenDoc failed. File may be corrupt or already open.")
+                if log_callback: log_callback(f"ERROR: OpenDoc failed. {_open_failure_reason(path)}")
                 return False
+            
+            # OpenDoc hands back a plain IDispatch; cast it so model calls are early-bound too
+            self.sw_model = _cast(self.sw_model, "IModelDoc2")
+            
+            self.model_path = path
+            self.doc_title = _get(self.sw_model, "GetTitle")
+            self._last_dims = {}
+            self._param_cache = {}
             return True
         except Exception as e:
-            if log_callback: log_callback(f"ERROR: Exception during open_document: {e}")
+            # pywintypes.com_error carries the HRESULT; matched by attribute so this handler
+            # doesn't need pywin32 imported to run
+            hresult = getattr(e, "hresult", None)
+            if hresult is not None:
+                if log_callback: log_callback(f"ERROR: COM error 0x{hresult & 0xFFFFFFFF:08X} during open_document. {_open_failure_reason(path)}")
+            elif log_callback:
+                log_callback(f"ERROR: Exception during open_document: {e}")
             return False
 
     def get_all_dimensions(self, log_callback=None):
-        """Uses a VBA macro to robustly extract dimensions bypassing Python COM limits."""
+        """Walks the feature tree over COM and collects every display dimension's full name."""
         if not self.sw_model:
             return []
         
-        macro_path = Path(__file__).parent / "GetDimensions.swp"
-        temp_file = Path(r"C:\temp\sw_dimensions.txt")
-        target_file = Path(r"C:\temp\sw_target_file.txt")
+        if log_callback: log_callback("Traversing the feature tree to extract dimensions...")
         
-        if not macro_path.exists():
-            if log_callback: log_callback(f"ERROR: Macro not found at {macro_path}")
-            return []
-            
-        if log_callback: log_callback("Executing GetDimensions.swp to extract dimensions natively...")
-        
-        # Ensure temp dir exists and clear old files
-        temp_file.parent.mkdir(parents=True, exist_ok=True)
-        for file in [temp_file, target_file]:
-            if file.exists():
-                try:
-                    file.unlink()
-                except:
-                    pass
-                    
-        # Write the target file path so VBA knows which document to process
-        try:
-            with open(target_file, 'w') as f:
-                path_attr = self.sw_model.GetPathName
-                model_path = path_attr() if callable(path_attr) else path_attr
-                f.write(model_path)
-        except Exception as e:
-            if log_callback: log_callback(f"ERROR: Failed to write target file: {e}")
-            return []
-            
-        # Run macro
-        try:
-            errs = win32.VARIANT(pythoncom.VT_BYREF | pythoncom.VT_I4, 0)
-            success = self.sw_app.RunMacro2(str(macro_path), "GetDimensions1", "main", 0, errs)
-            
-            if not success:
-                if log_callback: log_callback(f"ERROR: Macro failed to run. Code: {errs.value}")
-                return []
-        except Exception as e:
-            if log_callback: log_callback(f"ERROR: Exception running macro: {e}")
-            return []
-            
-        # Wait for the macro to finish writing the file
-        max_wait = 50 # 5 seconds max
-        while not temp_file.exists() and max_wait > 0:
-            time.sleep(0.1)
-            max_wait -= 1
-            
-        if not temp_file.exists():
-            if log_callback: log_callback("ERROR: Macro ran but sw_dimensions.txt was not created.")
-            return []
-            
-        # Read dimensions from the text file
-        dims = set()
+        # A dict dedupes while keeping feature-tree order, which is how users scan the part
+        dims = {}
         try:
-            with open(temp_file, 'r') as f:
-                for line in f:
-                    dim = line.strip()
-                    if dim:
-                        dims.add(dim)
-                        if log_callback: log_callback(f"  -> Found dimension: {dim}")
+            feat = _get(self.sw_model, "FirstFeature")
+            while feat is not None:
+                # Sketch dimensions live on the sketches absorbed under each feature
+                sub_feat = _get(feat, "GetFirstSubFeature")
+                for owner in [feat] + _collect_sub_features(sub_feat):
+                    disp_dim = _get(owner, "GetFirstDisplayDimension")
+                    while disp_dim is not None:
+                        dim = disp_dim.GetDimension2(0)
+                        if dim is not None:
+                            name = _get(dim, "FullName")
+                            if name and name not in dims:
+                                dims[name] = None
+                                if log_callback: log_callback(f"  -> Found dimension: {name}")
+                        disp_dim = owner.GetNextDisplayDimension(disp_dim)
+                feat = _get(feat, "GetNextFeature")
         except Exception as e:
-            if log_callback: log_callback(f"ERROR: Failed to read output file: {e}")
+            if log_callback: log_callback(f"ERROR: Exception while traversing features: {e}")
             
         if log_callback: log_callback(f"Successfully extracted {len(dims)} unique dimensions.")
         
-        return sorted(list(dims))
+        return list(dims)
+
+    def dimension_is_current(self, dim_name, value):
+        """True if value (mm) is what this controller last wrote to dim_name."""
+        return abs(float(value) - self._last_dims.get(dim_name, math.nan)) < 1e-9
 
     def modify_dimension(self, dim_name, new_value):
-        """Modifies a specific dimension. Assumes input is in millimeters."""
+        """Modifies a specific dimension. Assumes input is in millimeters.
+        
+        A value equal to the one last written is not sent to SolidWorks again.
+        """
+        new_value = float(new_value)
+        if self.dimension_is_current(dim_name, new_value):
+            return True
         try:
-            param = self.sw_model.Parameter(dim_name)
+            # Resolving a parameter by name is a feature-tree lookup plus a COM round-trip,
+            # so keep the proxy for the lifetime of the open document.
+            param = self._param_cache.get(dim_name)
+            if param is None:
+                param = self.sw_model.Parameter(dim_name)
+                if param:
+                    self._param_cache[dim_name] = param
             if param:
                 # SystemValue is strictly in meters, so we convert mm to meters
-                param.SystemValue = float(new_value) / 1000.0
+                param.SystemValue = new_value / 1000.0
+                self._last_dims[dim_name] = new_value
                 return True
             return False
         except Exception as e:
@@ -151,7 +218,11 @@ class SolidWorksController:
             
         try:
             # API exports explicitly REQUIRE an absolute path
-            abs_path = os.path.abspath(str(output_path))
+            abs_path = os.path.abspath(output_path)
+            try:
+                self._apply_export_preferences(os.path.splitext(abs_path)[1].lower())
+            except Exception as e:
+                if log_callback: log_callback(f"  -> Could not apply compact export settings: {e}")
             
             # The 'Type Mismatch' error (Code 4) is caused by passing None to the 4th argument
             # of Extension.SaveAs. To bypass this COM limitation in Python, we will use the 
@@ -170,16 +241,93 @@ class SolidWorksController:
             if log_callback: log_callback(f"  -> Exception during export: {e}")
             return False
 
+    def _apply_export_preferences(self, ext):
+        """Switches to smaller, faster-to-write STEP/STL output when compact_export is set.
+        
+        These are application-wide SolidWorks settings, so each one is changed once per
+        session and the user's original value is put back by close().
+        """
+        if not self.compact_export:
+            return
+        if ext in (".step", ".stp") and ("int", SW_STEP_AP) not in self._saved_prefs:
+            # AP203 drops the colour/layer metadata AP214 carries
+            self._saved_prefs[("int", SW_STEP_AP)] = self.sw_app.GetUserPreferenceIntegerValue(SW_STEP_AP)
+            self.sw_app.SetUserPreferenceIntegerValue(SW_STEP_AP, 203)
+        elif ext == ".stl" and ("toggle", SW_STL_BINARY_FORMAT) not in self._saved_prefs:
+            self._saved_prefs[("toggle", SW_STL_BINARY_FORMAT)] = self.sw_app.GetUserPreferenceToggle(SW_STL_BINARY_FORMAT)
+            self.sw_app.SetUserPreferenceToggle(SW_STL_BINARY_FORMAT, True)
+
+    def _restore_export_preferences(self):
+        """Puts back any export preferences changed by _apply_export_preferences."""
+        for (kind, pref), value in self._saved_prefs.items():
+            try:
+                if kind == "int":
+                    self.sw_app.SetUserPreferenceIntegerValue(pref, value)
+                else:
+                    self.sw_app.SetUserPreferenceToggle(pref, value)
+            except:
+                pass
+        self._saved_prefs = {}
+
+    def detach(self):
+        """Releases this thread's COM references but leaves the document open in SolidWorks.
+        
+        COM proxies are bound to the thread that created them, so a controller handed to
+        another thread must detach() here and connect() again there. open_document() then
+        picks up the already-loaded part instead of reading it from disk again.
+        """
+        self.sw_model = None
+        self.sw_app = None
+        self._param_cache = {}
+
+    def export_configuration(self, dims, output_path, display_path=None, log_callback=None):
+        """Applies a row of dimensions (mm), rebuilds only if something changed, then exports.
+        
+        display_path is what gets logged when output_path is only a staging location.
+        """
+        if not self.sw_model:
+            return False
+        
+        any_changed = False
+        failed = []
+        for dim_name, val in dims.items():
+            if self.dimension_is_current(dim_name, val):
+                continue
+            if self.modify_dimension(dim_name, val):
+                if log_callback: log_callback(f"Setting {dim_name} = {val}")
+                any_changed = True
+            else:
+                failed.append(dim_name)
+                if log_callback: log_callback(f"ERROR: Failed to set {dim_name} = {val}")
+        
+        if any_changed:
+            if log_callback: log_callback("Rebuilding model...")
+            self.rebuild()
+        elif not failed and log_callback:
+            log_callback("Dimensions unchanged from previous row, skipping rebuild.")
+        
+        # Exporting would produce geometry that doesn't match the row, so fail it instead
+        if failed:
+            if log_callback: log_callback(f"ERROR: Skipping export, {len(failed)} dimension(s) could not be set.")
+            return False
+        
+        if log_callback: log_callback(f"Exporting to: {display_path or output_path}")
+        return self.export_file(output_path, log_callback=log_callback)
+
     def close(self):
         """Closes the active document cleanly to release file locks."""
-        if self.sw_app and self.sw_model:
+        if self.sw_app:
+            self._restore_export_preferences()
+        if self.sw_app and self.doc_title:
             try:
-                title_attr = self.sw_model.GetTitle
-                doc_name = title_attr() if callable(title_attr) else title_attr
-                self.sw_app.CloseDoc(doc_name)
+                self.sw_app.CloseDoc(self.doc_title)
             except:
                 pass
         
         # Explicitly release COM objects to allow the process to terminate
         self.sw_model = None
-        self.sw_app = None
\ No newline at end of file
+        self.sw_app = None
+        self.model_path = None
+        self.doc_title = None
+        self._last_dims = {}
+        self._param_cache = {}